@@ -1,5 +1,182 @@
 import numpy as np
-from scipy.optimize import root_scalar
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # numba is optional; without it the NumPy implementations are used.
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Fast-math flags for the kernels, without 'nnan' and 'ninf' so that, together with the
+# NumPy error model, invalid yields give nan/inf as in the NumPy code path instead of raising.
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(cache=True, fastmath=_FASTMATH, error_model='numpy')
+def _price_kernel(cf, y, m):
+    '''
+    Compiled present value of the cash flows. For the short arrays of a typical bond
+    an explicit loop beats the per-call dispatch overhead of NumPy.
+    '''
+    base = 1.0 + y / m
+    disc = 1.0
+    s = 0.0
+    for i in range(cf.size):
+        disc *= base
+        s += cf[i] / disc
+    return s
+
+
+@njit(cache=True, fastmath=_FASTMATH, error_model='numpy')
+def _analytics_kernel(cf, t, n, y, m):
+    '''
+    Compiled counterpart of Bond.analytics, returning (price, Macaulay, Modified, convexity).
+    '''
+    base = 1.0 + y / m
+    disc = 1.0
+    pv = 0.0
+    weighted_times = 0.0
+    convexity_sum = 0.0
+    for i in range(cf.size):
+        disc *= base
+        pv_term = cf[i] / disc
+        pv += pv_term
+        weighted_times += t[i] * pv_term
+        convexity_sum += n[i] * (n[i] + 1.0) * pv_term
+    macaulay = weighted_times / pv
+    modified = macaulay / base
+    convexity = convexity_sum / (pv * base * base * m * m)
+    return pv, macaulay, modified, convexity
+
+
+@njit(cache=True, fastmath=_FASTMATH, error_model='numpy')
+def _price_and_dprice_kernel(cf, n, y, m):
+    '''
+    Compiled price of the bond and its derivative with respect to the yield.
+    '''
+    base = 1.0 + y / m
+    disc = 1.0
+    pv = 0.0
+    weighted_periods = 0.0
+    for i in range(cf.size):
+        disc *= base
+        pv_term = cf[i] / disc
+        pv += pv_term
+        weighted_periods += n[i] * pv_term
+    return pv, -weighted_periods / (m * base)
+
+
+@njit(cache=True, error_model='numpy')
+def _brenth_step(xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, xtol):
+    '''
+    One iteration of Brent's method with hyperbolic extrapolation, following scipy's brenth.
+    Takes the solver state once f(xcur) is known and returns (converged, new state); unless
+    converged, the caller evaluates f at the new xcur before the next step.
+    '''
+    rtol = 8.881784197001252e-16  # 4 * machine epsilon, as in scipy
+    if fpre != 0 and fcur != 0 and (fpre > 0) != (fcur > 0):
+        xblk, fblk = xpre, fpre
+        spre = scur = xcur - xpre
+    if abs(fblk) < abs(fcur):
+        xpre, xcur, xblk = xcur, xblk, xcur
+        fpre, fcur, fblk = fcur, fblk, fcur
+
+    delta = (xtol + rtol * abs(xcur)) / 2
+    sbis = (xblk - xcur) / 2
+    if fcur == 0 or abs(sbis) < delta:
+        return True, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur
+
+    if abs(spre) > delta and abs(fcur) < abs(fpre):
+        if xpre == xblk:
+            # interpolate
+            stry = -fcur * (xcur - xpre) / (fcur - fpre)
+        else:
+            # extrapolate
+            dpre = (fpre - fcur) / (xpre - xcur)
+            dblk = (fblk - fcur) / (xblk - xcur)
+            stry = -fcur * (fblk - fpre) / (fblk * dpre - fpre * dblk)
+        if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+            # accept the interpolated step
+            spre, scur = scur, stry
+        else:
+            spre, scur = sbis, sbis
+    else:
+        spre, scur = sbis, sbis
+
+    xpre, fpre = xcur, fcur
+    if abs(scur) > delta:
+        xcur += scur
+    else:
+        xcur += delta if sbis > 0 else -delta
+    return False, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur
+
+
+@njit(cache=True, fastmath=_FASTMATH, error_model='numpy')
+def _ytm_brenth_kernel(cf, m, market_price, xa, xb, xtol, maxiter):
+    '''
+    Compiled brenth search for the yield at which the bond prices at market_price.
+    The objective is evaluated inline, so the whole root search runs without returning
+    to the interpreter.
+
+    Returns:
+        tuple: (root, converged).
+    '''
+    fpre = _price_kernel(cf, xa, m) - market_price
+    fcur = _price_kernel(cf, xb, m) - market_price
+    if fpre == 0:
+        return xa, True
+    if fcur == 0:
+        return xb, True
+    if (fpre > 0) == (fcur > 0):
+        raise ValueError('f(a) and f(b) must have different signs')
+
+    xpre, xcur, xblk, fblk, spre, scur = xa, xb, 0.0, 0.0, 0.0, 0.0
+    for _ in range(maxiter):
+        converged, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur = _brenth_step(
+            xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, xtol)
+        if converged:
+            return xcur, True
+        fcur = _price_kernel(cf, xcur, m) - market_price
+    return xcur, False
+
+
+def _brenth(f, args, xa, xb, xtol, maxiter):
+    '''
+    Brent's method with hyperbolic extrapolation for any callable f(x, *args).
+    Used for the YTM search when numba is not available.
+
+    Returns:
+        tuple: (root, converged).
+    '''
+    fpre = f(xa, *args)
+    fcur = f(xb, *args)
+    if fpre == 0:
+        return xa, True
+    if fcur == 0:
+        return xb, True
+    if (fpre > 0) == (fcur > 0):
+        raise ValueError('f(a) and f(b) must have different signs')
+
+    xpre, xcur, xblk, fblk, spre, scur = xa, xb, 0.0, 0.0, 0.0, 0.0
+    for _ in range(maxiter):
+        converged, xpre, xcur, xblk, fpre, fcur, fblk, spre, scur = _brenth_step(
+            xpre, xcur, xblk, fpre, fcur, fblk, spre, scur, xtol)
+        if converged:
+            return xcur, True
+        fcur = f(xcur, *args)
+    return xcur, False
+
+
+# Number of yields whose analytics are memoized per bond.
+_ANALYTICS_CACHE_SIZE = 16
+
+# Range of yields searched by the YTM solvers; every solver path stays inside it.
+_YTM_LOWER = 0.0001
+_YTM_UPPER = 1.0
+
 
 class Bond:
     '''
@@ -10,32 +187,161 @@ class Bond:
         coupon_rate (float): The annual coupon rate(as a decimal).
         maturity (float): The time to maturity in years.
         coupon_frequency (int): Number of coupon payments per year.
+        dtype (np.dtype): Floating point type used by analytics_array, float32 or float64. float32 halves the memory
+            traffic of the vectorized analytics and is accurate to about 7 significant digits,
+            enough for prices and risk measures. The single-yield methods and the YTM solvers
+            always work in float64.
+
+    A bond is treated as immutable once constructed: the cash flows and the analytics
+    for recently used yields are cached and are not refreshed if attributes are changed.
     '''
 
-    def __init__(self, face_value: float, coupon_rate: float, maturity: float, coupon_frequency:int=1):
+    def __init__(self, face_value: float, coupon_rate: float, maturity: float, coupon_frequency:int=1, dtype=np.float64):
         if coupon_frequency <=0:
             raise ValueError('Coupon frequency must be a positive integer.')
+        if int(maturity * coupon_frequency) <= 0:
+            raise ValueError('Maturity must cover at least one coupon period.')
+        if np.dtype(dtype) not in (np.float32, np.float64):
+            raise ValueError('dtype must be float32 or float64.')
         self.face_value = face_value
         self.coupon_rate = coupon_rate
         self.maturity = maturity
         self.coupon_frequency = coupon_frequency
         self.periods = int(maturity * coupon_frequency)
         self.coupon = self.face_value * self.coupon_rate / self.coupon_frequency
+        self.dtype = np.dtype(dtype)
+
+        # Cash flows and timings do not depend on the yield, so build them once.
+        # _n is the integer period index m * t, stored as floats for the arithmetic below.
+        self._n = np.arange(1, self.periods + 1, dtype=np.float64)
+        self._t = self._n / self.coupon_frequency
+        self._cf = np.full(self.periods, self.coupon)
+        self._cf[-1] += self.face_value
+        self._convexity_weights = self._n * (self._n + 1.0)
+        # Weights for analytics_array in the requested precision (the same arrays for float64).
+        self._batch_t = self._t.astype(self.dtype, copy=False)
+        self._batch_convexity_weights = self._convexity_weights.astype(self.dtype, copy=False)
+
+        # Scratch space reused by the NumPy code path so repeated evaluations allocate nothing.
+        self._disc_buf = np.empty(self.periods, dtype=np.float64)
+
+        # Results of earlier calls, reused by compute_ytm and the analytics methods.
+        self._last_ytm = None
+        self._analytics_cache = {}
 
     def cash_flows(self) -> np.ndarray:
         '''
         Returns the array of cash flows for each period.
         '''
-        flows = np.full(self.periods, self.coupon)
-        flows[-1] += self.face_value
-        return flows
+        return self._cf.copy()
     
     def time_periods(self) -> np.ndarray:
         '''
         Returns the array of time (in years) corresponding to each cash flow.
         '''
-        return np.arange(1, self.periods + 1) / self.coupon_frequency
+        return self._t.copy()
     
+    def _discount_factors(self, base: float) -> np.ndarray:
+        '''
+        Returns the discount factor of each period for the per-period growth factor base = 1 + y/m.
+        The result lives in a scratch buffer and is overwritten by the next call.
+        '''
+        # m * t is the integer period index, so the discount factors are successive powers
+        # of the same base; a running product avoids evaluating a float power per period.
+        disc = self._disc_buf
+        disc.fill(1.0 / base)
+        return np.cumprod(disc, out=disc)
+
+    def _pv_from_disc(self, disc: np.ndarray):
+        '''
+        Returns the price for discount factors over the last axis of disc (one row per yield if 2-D).
+        The cash flows are a level coupon plus the face value in the last period, so the price
+        is a coupon annuity term plus a single principal term.
+        '''
+        # Cast the scalars so float32 discount factors are not promoted by a float64 face value.
+        coupon, face_value = disc.dtype.type(self.coupon), disc.dtype.type(self.face_value)
+        return coupon * disc.sum(axis=-1) + face_value * disc[..., -1]
+
+    def _weighted_pv(self, weights: np.ndarray, disc: np.ndarray):
+        '''
+        Returns sum(weights * cash flows * disc) over the last axis of disc without building
+        the cash-flow array, split like _pv_from_disc into annuity and principal terms.
+        '''
+        coupon, face_value = disc.dtype.type(self.coupon), disc.dtype.type(self.face_value)
+        return coupon * (disc @ weights) + face_value * weights[-1] * disc[..., -1]
+
+    def analytics(self, yield_rate: float) -> tuple:
+        '''
+        Computes price, Macaulay Duration, Modified Duration and convexity in a single pass.
+        The discount factors are shared by all four measures, so they are computed only once.
+        Results are cached per yield, so querying the individual measures for the same yield
+        repeats no work.
+
+        Args:
+            yield_rate (float): Annual yield rate as a decimal.
+
+        Returns:
+            tuple: (price, Macaulay Duration, Modified Duration, convexity).
+        '''
+        key = round(yield_rate, 12)
+        cached = self._analytics_cache.get(key)
+        if cached is not None:
+            return cached
+        if _HAS_NUMBA:
+            result = _analytics_kernel(self._cf, self._t, self._n, yield_rate, self.coupon_frequency)
+        else:
+            result = self._analytics_numpy(yield_rate)
+        if len(self._analytics_cache) >= _ANALYTICS_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order.
+            del self._analytics_cache[next(iter(self._analytics_cache))]
+        self._analytics_cache[key] = result
+        return result
+
+    def _analytics_numpy(self, yield_rate: float) -> tuple:
+        '''
+        NumPy implementation of analytics, used when numba is not available.
+        '''
+        m = self.coupon_frequency
+        base = 1.0 + yield_rate / m
+        disc = self._discount_factors(base)
+        pv = self._pv_from_disc(disc)
+        macaulay = self._weighted_pv(self._t, disc) / pv
+        modified = macaulay / base
+        convexity = self._weighted_pv(self._convexity_weights, disc) / (pv * base * base * m * m)
+        return pv, macaulay, modified, convexity
+
+    def analytics_array(self, yields: np.ndarray) -> dict:
+        '''
+        Computes price, Macaulay Duration, Modified Duration and convexity for many yields at once.
+        All scenarios are evaluated with broadcast array operations over a (yields x periods) grid
+        in the bond's dtype.
+
+        Args:
+            yields (np.ndarray): Annual yield rates as decimals, as a scalar or a 1-D array.
+
+        Returns:
+            dict: Arrays keyed by 'price', 'macaulay_duration', 'modified_duration' and 'convexity',
+                one entry per yield (1-D).
+
+        Raises:
+            ValueError: If the yields are not 1-D.
+        '''
+        yields = np.atleast_1d(np.asarray(yields, dtype=self.dtype))
+        if yields.ndim != 1:
+            raise ValueError('Yields must be a scalar or a 1-D array.')
+        m = self.coupon_frequency
+        base = 1.0 + yields[:, None] / m
+        disc = np.cumprod(np.broadcast_to(1.0 / base, (base.shape[0], self.periods)), axis=1)
+        base = base[:, 0]
+        pv = self._pv_from_disc(disc)
+        macaulay = self._weighted_pv(self._batch_t, disc) / pv
+        return {
+            'price': pv,
+            'macaulay_duration': macaulay,
+            'modified_duration': macaulay / base,
+            'convexity': self._weighted_pv(self._batch_convexity_weights, disc) / (pv * base * base * m * m),
+        }
+
     def price(self, yield_rate: float) -> float:
         '''
         Computes the price of the bond given a yield rate.
@@ -47,10 +353,12 @@ class Bond:
             float: Present value (price) of the bond.
         
         '''
-        t = self.time_periods()
-        cf = self.cash_flows()
-        discount_factors = 1 / (1 + yield_rate / self.coupon_frequency) ** (self.coupon_frequency * t)
-        return np.sum(cf * discount_factors)
+        cached = self._analytics_cache.get(round(yield_rate, 12))
+        if cached is not None:
+            return cached[0]
+        if _HAS_NUMBA:
+            return _price_kernel(self._cf, yield_rate, self.coupon_frequency)
+        return self.analytics(yield_rate)[0]
 
     def macaulay_duration(self, yield_rate: float) -> float:
         '''
@@ -62,12 +370,7 @@ class Bond:
         Returns:
             float: Macaulay Duration in years.
         '''
-        t = self.time_periods()
-        cf = self.cash_flows()
-        discount_factors = 1 / (1 + yield_rate / self.coupon_frequency) ** (self.coupon_frequency * t)
-        pv = np.sum(cf * discount_factors)
-        weighted_times = t * cf * discount_factors
-        return np.sum(weighted_times) / pv
+        return self.analytics(yield_rate)[1]
     
     def modified_duration(self, yield_rate: float) -> float:
         '''
@@ -79,8 +382,7 @@ class Bond:
         Returns:
             float: Modified Duration in years.
         '''
-        macaulay = self.macaulay_duration(yield_rate)
-        return macaulay / (1 + yield_rate / self.coupon_frequency)
+        return self.analytics(yield_rate)[2]
     
     def convexity(self, yield_rate: float) -> float:
         '''
@@ -92,35 +394,175 @@ class Bond:
         Returns:
             float: Convexity measure.
         '''
-        periods = np.arange(1, self.periods + 1)
-        cf = self.cash_flows()
-        y = yield_rate
-        price_adjusted = np.sum([cf[i - 1] / (1 + y / self.coupon_frequency) ** i for i in periods])
-        convexity_sum = np.sum([periods[i - 1] * (periods[i - 1] + 1) * cf[i - 1] / (1 + y / self.coupon_frequency) ** (i + 2) for i in periods])
-        return convexity_sum / (price_adjusted * self.coupon_frequency ** 2)
+        return self.analytics(yield_rate)[3]
     
-    def compute_ytm(self, market_price: float, guess: float=0.05, tol: float=1e-6, max_iter: int=100) -> float:
+    def _price_and_dprice(self, yield_rate: float) -> tuple:
+        '''
+        Computes the price of the bond and its derivative with respect to the yield in one pass.
+        '''
+        if _HAS_NUMBA:
+            return _price_and_dprice_kernel(self._cf, self._n, yield_rate, self.coupon_frequency)
+        m = self.coupon_frequency
+        base = 1.0 + yield_rate / m
+        disc = self._discount_factors(base)
+        pv = self._pv_from_disc(disc)
+        return pv, -self._weighted_pv(self._n, disc) / (m * base)
+
+    def compute_ytm(self, market_price: float, guess: float=None, tol: float=1e-6, max_iter: int=100) -> float:
         '''
         Computes the Yield to Maturity (YTM) given the market price of the bond.
-        Uses a numerical root-finding algorithm (Brent's method).
+        Uses Newton's method with the closed-form price derivative, which converges in a few
+        steps from a reasonable guess. If Newton's method stops making progress, falls back to
+        Brent's method with hyperbolic extrapolation on a bracket around the guess.
 
         Args:
             market_price (float): Observed market price of the bond.
-            guess (float, optional): Initial guess for the yield. Defaults to 0.05
-            tol (float, optional): Tolerance for convergence. Defaults to 1e-6.
+            guess (float, optional): Initial guess for the yield, used as Newton's starting point and to centre the search bracket. Defaults to the yield from the last successful call on this bond, or 0.05 on the first call.
+            tol (float, optional): Tolerance on the yield for convergence. Defaults to 1e-6.
             max_iter (int, optional): Maximum iterations. Defaults to 100.
 
         Returns:
             float: Yield to Maturity as annual rate.
 
         Raises:
-            ValueError: If the numerical solver does not converge.
+            ValueError: If the yield is not between 0.01% and 100% or the numerical solver does not converge.
         '''
+        # Prices move continuously with yield, so the previous solution is a good starting point.
+        if guess is None:
+            guess = 0.05 if self._last_ytm is None else self._last_ytm
+        y = guess
+        prev_err = np.inf
+        for _ in range(max_iter):
+            # Newton must not accept yields the bracketed fallback could not find.
+            if not _YTM_LOWER <= y <= _YTM_UPPER:
+                break
+            p, dp = self._price_and_dprice(y)
+            err = p - market_price
+            # Stop as soon as the error no longer shrinks (this also catches NaN) and use Brent.
+            if not abs(err) < abs(prev_err) or dp == 0:
+                break
+            prev_err = err
+            step = err / dp
+            y -= step
+            if abs(step) < tol and _YTM_LOWER <= y <= _YTM_UPPER:
+                self._last_ytm = y
+                return y
+
         def f(y):
             return self.price(y) - market_price
-        sol = root_scalar(f, bracket=[0.0001, 1.0], method='brentq', xtol=tol, maxiter=max_iter)
-        if sol.converged:
-            return sol.root
+
+        # Start from a tight bracket around the guess and widen it only if it misses the root.
+        lo, hi = _YTM_LOWER, _YTM_UPPER
+        if lo < guess < hi:
+            lo_try, hi_try = max(lo, guess * 0.5), min(hi, guess * 2.0)
+            f_lo, f_hi = f(lo_try), f(hi_try)
+            for _ in range(5):
+                if f_lo * f_hi <= 0:
+                    break
+                # Widen the side that misses the root, unless it already reached the search range.
+                if f_lo < 0:
+                    if lo_try == lo:
+                        break
+                    lo_try = max(lo, lo_try * 0.5)
+                    f_lo = f(lo_try)
+                else:
+                    if hi_try == hi:
+                        break
+                    hi_try = min(hi, hi_try * 2.0)
+                    f_hi = f(hi_try)
+            if f_lo * f_hi <= 0:
+                lo, hi = lo_try, hi_try
+        if _HAS_NUMBA:
+            root, converged = _ytm_brenth_kernel(self._cf, self.coupon_frequency, float(market_price),
+                                                 float(lo), float(hi), float(tol), max_iter)
+        else:
+            root, converged = _brenth(f, (), lo, hi, tol, max_iter)
+        if converged:
+            self._last_ytm = root
+            return root
         else:
             raise ValueError('YTM calculation did not converge.')
-        
\ No newline at end of file
+        
+    def compute_ytm_batch(self, market_prices: np.ndarray, tol: float=1e-6, max_iter: int=50) -> np.ndarray:
+        '''
+        Computes the Yield to Maturity for many market prices of the bond at once.
+        Runs Brent's method elementwise on arrays, so every price is solved by the same
+        vectorized iterations instead of one Python-level root search per price.
+
+        Args:
+            market_prices (np.ndarray): Observed market prices of the bond, as a scalar or a 1-D array.
+            tol (float, optional): Tolerance on the yield for convergence. Defaults to 1e-6.
+            max_iter (int, optional): Maximum iterations. Defaults to 50.
+
+        Returns:
+            np.ndarray: Yields to Maturity as annual rates, one per market price (1-D).
+
+        Raises:
+            ValueError: If the prices are not 1-D, a price is not bracketed by the search interval
+                or the solver does not converge.
+        '''
+        prices = np.atleast_1d(np.asarray(market_prices, dtype=np.float64))
+        if prices.ndim != 1:
+            raise ValueError('Market prices must be a scalar or a 1-D array.')
+        m = self.coupon_frequency
+        rtol = 4 * np.finfo(np.float64).eps
+
+        def f(y):
+            # Discount factors are powers of 1/(1 + y/m) over the integer period index m * t.
+            disc = np.cumprod(np.broadcast_to(1.0 / (1.0 + y[:, None] / m), (y.size, self.periods)), axis=1)
+            return disc @ self._cf - prices
+
+        xpre = np.full(prices.shape, _YTM_LOWER)
+        xcur = np.full(prices.shape, _YTM_UPPER)
+        fpre = f(xpre)
+        fcur = f(xcur)
+        if np.any((fpre != 0) & (fcur != 0) & (np.signbit(fpre) == np.signbit(fcur))):
+            raise ValueError('Market prices must lie between the bond prices at yields of 0.01% and 100%.')
+
+        # A root found at the lower end of the bracket is moved to the current estimate.
+        at_lower = fpre == 0
+        xcur = np.where(at_lower, xpre, xcur)
+        fcur = np.where(at_lower, 0.0, fcur)
+        xblk = np.zeros_like(prices)
+        fblk = np.zeros_like(prices)
+        spre = np.zeros_like(prices)
+        scur = np.zeros_like(prices)
+
+        for _ in range(max_iter):
+            flip = (fpre != 0) & (fcur != 0) & (np.signbit(fpre) != np.signbit(fcur))
+            xblk = np.where(flip, xpre, xblk)
+            fblk = np.where(flip, fpre, fblk)
+            spre = np.where(flip, xcur - xpre, spre)
+            scur = np.where(flip, xcur - xpre, scur)
+
+            # Keep the best estimate in xcur and the other end of the bracket in xblk.
+            swap = np.abs(fblk) < np.abs(fcur)
+            xpre, xcur, xblk = np.where(swap, xcur, xpre), np.where(swap, xblk, xcur), np.where(swap, xcur, xblk)
+            fpre, fcur, fblk = np.where(swap, fcur, fpre), np.where(swap, fblk, fcur), np.where(swap, fcur, fblk)
+
+            delta = (tol + rtol * np.abs(xcur)) / 2
+            sbis = (xblk - xcur) / 2
+            converged = (fcur == 0) | (np.abs(sbis) < delta)
+            if converged.all():
+                return xcur
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                secant = -fcur * (xcur - xpre) / (fcur - fpre)
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                inverse_quadratic = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            stry = np.where(xpre == xblk, secant, inverse_quadratic)
+
+            # Fall back to bisection wherever interpolation would not shrink the bracket fast enough.
+            interpolate = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+            good_step = interpolate & (2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta))
+            spre = np.where(good_step, scur, sbis)
+            scur = np.where(good_step, stry, sbis)
+
+            xpre = xcur
+            fpre = fcur
+            step = np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+            xcur = np.where(converged, xcur, xcur + step)
+            fcur = f(xcur)
+
+        raise ValueError('YTM calculation did not converge.')
@@ -1,3 +1,4 @@
+import numpy as np
 from app.Bond import Bond
 
 def main():
@@ -18,13 +19,11 @@ def main():
     print(f'Base yield = {base_yield}\n')
     print("   Shock      Yield      Price      Macaulay Dur.  Modified Dur.  Convexity")
     print("   -----      -----      -----      -------------  -------------  ---------")
-    for shock in yield_shocks:
-        new_yield = base_yield + shock
-        price = bond.price(new_yield)
-        macaulay_dur = bond.macaulay_duration(new_yield)
-        modified_dur = bond.modified_duration(new_yield)
-        convex = bond.convexity(new_yield)
-
+    new_yields = base_yield + np.array(yield_shocks)
+    results = bond.analytics_array(new_yields)
+    for shock, new_yield, price, macaulay_dur, modified_dur, convex in zip(
+            yield_shocks, new_yields, results['price'], results['macaulay_duration'],
+            results['modified_duration'], results['convexity']):
         print(f' {shock:+7.1%}   {new_yield:7.2%}   ${price:10.2f}'
         f'       {macaulay_dur:6.3f}'
         f'          {modified_dur:6.3f}'
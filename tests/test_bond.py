@@ -1,4 +1,11 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest import mock
+import numpy as np
+from app import Bond as bond_module
 from app.Bond import Bond
 
 class TestBondCalculations(unittest.TestCase):
@@ -25,6 +32,13 @@ class TestBondCalculations(unittest.TestCase):
 
         self.assertAlmostEqual(computed_price, expected_price, places=2, msg=f'Computed price {computed_price} is not clode to expected price of {expected_price}')
 
+    def test_maturity_shorter_than_one_period(self):
+        '''
+        Tests that a bond without any coupon period is rejected.
+        '''
+        with self.assertRaises(ValueError):
+            Bond(1000, 0.05, 0.5, 1)
+
     def test_modified_duration(self):
         '''
         Tests the Modified Duration for a 4-year, 8% annual coupon bond with 5% annual yield.
@@ -42,6 +56,110 @@ class TestBondCalculations(unittest.TestCase):
 
         self.assertAlmostEqual(computed_mod_duration, expected_mod_duration, places=2, msg=f'Computed modified duration {computed_mod_duration} is not close to expected {expected_mod_duration}')
 
+    def test_analytics(self):
+        '''
+        Tests the fused analytics for the bond used in test_price against the values
+        printed by main.py for the 3% scenario.
+        '''
+        bond = Bond(1000, 0.06, 5, 2)
+        yield_rate = 0.03
+
+        price, macaulay, modified, convexity = bond.analytics(yield_rate)
+
+        self.assertAlmostEqual(price, 1138.33, places=2, msg=f'Computed price {price} is not close to expected price of 1138.33')
+        self.assertAlmostEqual(macaulay, 4.438, places=3, msg=f'Computed Macaulay Duration {macaulay} is not close to expected 4.438')
+        self.assertAlmostEqual(modified, 4.373, places=3, msg=f'Computed modified duration {modified} is not close to expected 4.373')
+        self.assertAlmostEqual(convexity, 22.7141, places=4, msg=f'Computed convexity {convexity} is not close to expected 22.7141')
+
+    def test_analytics_cache(self):
+        '''
+        Tests that analytics are memoized per yield and the cache stays bounded.
+        '''
+        bond = Bond(1000, 0.06, 5, 2)
+
+        first = bond.analytics(0.03)
+
+        self.assertIs(bond.analytics(0.03), first)
+        self.assertEqual(bond.modified_duration(0.03), first[2])
+        for i in range(40):
+            bond.analytics(0.01 + i * 0.001)
+        self.assertLessEqual(len(bond._analytics_cache), bond_module._ANALYTICS_CACHE_SIZE)
+
+    def test_analytics_without_numba(self):
+        '''
+        Tests that the NumPy fallback agrees with the default implementation.
+        '''
+        expected = Bond(1000, 0.06, 5, 2).analytics(0.03)
+
+        with mock.patch.object(bond_module, '_HAS_NUMBA', False):
+            bond = Bond(1000, 0.06, 5, 2)
+            computed = bond.analytics(0.03)
+            computed_price = bond.price(0.03)
+
+        for c, e in zip(computed, expected):
+            self.assertAlmostEqual(c, e, places=8)
+        self.assertAlmostEqual(computed_price, expected[0], places=8)
+
+    def test_analytics_array(self):
+        '''
+        Tests that the vectorized analytics agree with analytics for each yield scenario.
+        '''
+        bond = Bond(1000, 0.06, 5, 2)
+        yields = [0.02, 0.03, 0.04]
+
+        results = bond.analytics_array(yields)
+
+        for i, yield_rate in enumerate(yields):
+            price, macaulay, modified, convexity = bond.analytics(yield_rate)
+            self.assertAlmostEqual(results['price'][i], price, places=8)
+            self.assertAlmostEqual(results['macaulay_duration'][i], macaulay, places=8)
+            self.assertAlmostEqual(results['modified_duration'][i], modified, places=8)
+            self.assertAlmostEqual(results['convexity'][i], convexity, places=8)
+
+        self.assertAlmostEqual(bond.analytics_array(0.03)['price'][0], bond.price(0.03), places=8)
+        with self.assertRaises(ValueError):
+            bond.analytics_array([[0.02, 0.03]])
+
+    def test_analytics_array_float32(self):
+        '''
+        Tests that single precision analytics stay within the tolerance of the textbook price in test_price,
+        and that the single-yield methods are unaffected by the dtype.
+        '''
+        bond = Bond(1000, 0.06, 5, 2, dtype=np.float32)
+
+        results = bond.analytics_array([0.03])
+
+        self.assertEqual(results['price'].dtype, np.float32)
+        self.assertAlmostEqual(float(results['price'][0]), 1138.33, places=2)
+        self.assertAlmostEqual(float(results['modified_duration'][0]), Bond(1000, 0.06, 5, 2).modified_duration(0.03), places=4)
+        self.assertEqual(bond.analytics(0.03), Bond(1000, 0.06, 5, 2).analytics(0.03))
+        self.assertEqual(Bond(np.float64(1000), 0.06, 5, 2, dtype=np.float32).analytics_array([0.03])['price'].dtype, np.float32)
+        for dtype in (np.int64, np.float16):
+            with self.assertRaises(ValueError):
+                Bond(1000, 0.06, 5, 2, dtype=dtype)
+
+    def test_compute_ytm_without_numba(self):
+        '''
+        Tests the pure Python Brent fallback of compute_ytm. A guess outside the search range
+        skips Newton's method, so the bracketed search alone must find the YTM of test_compute_ytm.
+        '''
+        bond = Bond(950.0, 0.05, 5, 1)
+
+        with mock.patch.object(bond_module, '_HAS_NUMBA', False):
+            computed_ytm = bond.compute_ytm(1100.0, guess=-0.5)
+
+        self.assertAlmostEqual(computed_ytm, 0.0168, places=3, msg=f'Computed YTM {computed_ytm:.4%} is not close to expected 1.6800%')
+
+    def test_invalid_yield(self):
+        '''
+        Tests that a nan yield gives nan results on both code paths rather than raising.
+        '''
+        for has_numba in (bond_module._HAS_NUMBA, False):
+            with mock.patch.object(bond_module, '_HAS_NUMBA', has_numba):
+                bond = Bond(1000, 0.06, 5, 2)
+                self.assertTrue(np.isnan(bond.price(float('nan'))))
+                self.assertTrue(np.isnan(bond.macaulay_duration(float('nan'))))
+
     def test_compute_ytm(self):
         '''
         Test the Yield to Maturity for the following bond:
@@ -64,6 +182,106 @@ class TestBondCalculations(unittest.TestCase):
 
         self.assertAlmostEqual(computed_ytm, expected_ytm, places=3, msg=f'Computed YTM {computed_ytm:.4%} is not close to expected {expected_ytm:.4%}')
 
+    def test_compute_ytm_warm_start(self):
+        '''
+        Tests that a repeated YTM solve starts from the previous yield and still finds the correct root.
+        '''
+        bond = Bond(950.0, 0.05, 5, 1)
+
+        first_ytm = bond.compute_ytm(1100.0)
+        second_ytm = bond.compute_ytm(1090.0)
+
+        self.assertAlmostEqual(bond.price(first_ytm), 1100.0, places=2)
+        self.assertAlmostEqual(bond.price(second_ytm), 1090.0, places=2)
+        self.assertEqual(bond._last_ytm, second_ytm)
+
+    def test_compute_ytm_warm_start_after_outlying_solve(self):
+        '''
+        Tests that an earlier failed or far-away solve does not break the next warm-started call.
+        '''
+        bond = Bond(1000, 0.02, 5, 1)
+
+        # A price of 1 implies a yield far above the search range, so nothing is remembered.
+        with self.assertRaises(ValueError):
+            bond.compute_ytm(1.0)
+        self.assertIsNone(bond._last_ytm)
+
+        # Starting from a yield near the top of the range must still reach one near the bottom.
+        self.assertAlmostEqual(bond.compute_ytm(61.71), 0.9, places=4)
+        computed_ytm = bond.compute_ytm(1097.0)
+
+        self.assertAlmostEqual(bond.price(computed_ytm), 1097.0, places=2)
+
+    def test_brenth(self):
+        '''
+        Tests the compiled and the generic Brent solvers used as the YTM fallback on the bond used in test_compute_ytm.
+        '''
+        bond = Bond(950.0, 0.05, 5, 1)
+
+        def f(y):
+            return bond.price(y) - 1100.0
+
+        for solve in (lambda lo, hi: bond_module._ytm_brenth_kernel(bond._cf, 1, 1100.0, lo, hi, 1e-6, 100),
+                      lambda lo, hi: bond_module._brenth(f, (), lo, hi, 1e-6, 100)):
+            computed_ytm, converged = solve(0.0001, 1.0)
+
+            self.assertTrue(converged)
+            self.assertAlmostEqual(computed_ytm, 0.0168, places=3, msg=f'Computed YTM {computed_ytm:.4%} is not close to expected 1.6800%')
+            with self.assertRaises(ValueError):
+                solve(0.05, 1.0)
+
+    @unittest.skipUnless(bond_module._HAS_NUMBA, 'numba is not installed')
+    def test_brenth_kernel_cached(self):
+        '''
+        Tests that a second process loads the compiled YTM solver from numba's on-disk cache
+        instead of compiling it again.
+        '''
+        script = (
+            'from app import Bond as bond_module\n'
+            'bond = bond_module.Bond(950.0, 0.05, 5, 1)\n'
+            'bond_module._ytm_brenth_kernel(bond._cf, 1, 1100.0, 0.0001, 1.0, 1e-6, 100)\n'
+            'print(sum(bond_module._ytm_brenth_kernel.stats.cache_hits.values()))\n'
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir)
+            runs = [subprocess.run([sys.executable, '-c', script], cwd=root, env=env,
+                                   capture_output=True, text=True, check=True) for _ in range(2)]
+
+        self.assertEqual(runs[0].stdout.strip(), '0')
+        self.assertEqual(runs[1].stdout.strip(), '1')
+
+    def test_compute_ytm_negative_yield(self):
+        '''
+        Tests that a price implying a negative yield is rejected by every solver path, whatever the guess.
+        '''
+        bond = Bond(1000, 0.02, 5, 1)
+
+        for guess in (None, 0.01, 0.5):
+            with self.assertRaises(ValueError):
+                bond.compute_ytm(1150.0, guess=guess)
+        with self.assertRaises(ValueError):
+            bond.compute_ytm_batch([1150.0])
+        with self.assertRaises(ValueError):
+            bond.compute_ytm(1.0)
+
+    def test_compute_ytm_batch(self):
+        '''
+        Tests that the vectorized YTM solver agrees with compute_ytm for several market prices
+        of the bond used in test_compute_ytm.
+        '''
+        bond = Bond(950.0, 0.05, 5, 1)
+        market_prices = [1100.0, 950.0, 800.0]
+
+        computed_ytms = bond.compute_ytm_batch(market_prices)
+
+        self.assertAlmostEqual(computed_ytms[0], 0.0168, places=3)
+        for market_price, computed_ytm in zip(market_prices, computed_ytms):
+            self.assertAlmostEqual(computed_ytm, bond.compute_ytm(market_price), places=6)
+        self.assertEqual(bond.compute_ytm_batch(1100.0).shape, (1,))
+        with self.assertRaises(ValueError):
+            bond.compute_ytm_batch([[1100.0, 950.0]])
+
 if __name__ == '__main__':
     unittest.main()
 